@@ -1,10 +1,22 @@
+import atexit
 import json
 import hashlib
 import os
+import threading
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
 from helix.config import GENESIS_HASH
 
+# Long-lived append descriptors keyed by absolute chain path. Each entry keeps
+# the (st_dev, st_ino) it was opened against so a replaced file is reopened.
+_APPEND_FDS: Dict[str, Tuple[int, int, int]] = {}
+_APPEND_LOCK = threading.Lock()
+
+# Last parsed block per absolute chain path, tagged with the file's
+# (st_ino, st_size, st_mtime_ns) so any rewrite or append invalidates it.
+_LAST_BLOCK_CACHE: Dict[str, Tuple[Tuple[int, int, int], Optional[Dict]]] = {}
+_TAIL_CHUNK = 4096
+
 
 def get_chain_tip(path: str = "blockchain.jsonl") -> str:
     """Return the ``block_id`` of the last block in ``path``."""
@@ -54,14 +66,114 @@ def get_chain_tip(path: str = "blockchain.jsonl") -> str:
     return entry.get("block_id", GENESIS_HASH)
 
 
+def _append_fd(path: str) -> int:
+    """Return a cached ``O_APPEND`` descriptor for ``path``."""
+    key = os.path.abspath(path)
+    cached = _APPEND_FDS.get(key)
+    if cached is not None:
+        fd, dev, ino = cached
+        try:
+            st = os.stat(key)
+        except FileNotFoundError:
+            st = None
+        if st is not None and (st.st_dev, st.st_ino) == (dev, ino):
+            return fd
+        os.close(fd)
+    fd = os.open(key, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    st = os.fstat(fd)
+    _APPEND_FDS[key] = (fd, st.st_dev, st.st_ino)
+    return fd
+
+
+def close_append_fds() -> None:
+    """Close every cached append descriptor; later appends reopen them."""
+    with _APPEND_LOCK:
+        for fd, _, _ in _APPEND_FDS.values():
+            os.close(fd)
+        _APPEND_FDS.clear()
+
+
+atexit.register(close_append_fds)
+
+
+def _append(path: str, data: bytes, sync: bool) -> Tuple[int, os.stat_result]:
+    """Write ``data`` to ``path`` and return the prior size and new stat."""
+    with _APPEND_LOCK:
+        fd = _append_fd(path)
+        start = os.fstat(fd).st_size
+        os.write(fd, data)
+        if sync:
+            os.fsync(fd)
+        return start, os.fstat(fd)
+
+
+def append_line(path: str, line: bytes, *, sync: bool = False) -> None:
+    """Append ``line`` to ``path`` through its cached append descriptor.
+
+    The write is a single ``os.write`` on an ``O_APPEND`` descriptor, so it
+    is visible to readers as soon as this returns.
+    """
+    _append(path, line, sync)
+
+
 def append_block(block_header: Dict, path: str = "blockchain.jsonl") -> None:
     """Append ``block_header`` to the chain at ``path`` as newline-delimited JSON."""
-    line = json.dumps(block_header, separators=(",", ":"))
-    file = Path(path)
-    with open(file, "a", encoding="utf-8") as f:
-        f.write(line + "\n")
-        f.flush()
-        os.fsync(f.fileno())
+    line = (json.dumps(block_header, separators=(",", ":")) + "\n").encode("utf-8")
+    start, st = _append(path, line, True)
+    # If nothing else wrote in between, our line is the tail: seed the
+    # last-block cache so the next finalize need not read the file.
+    if st.st_size == start + len(line):
+        _LAST_BLOCK_CACHE[os.path.abspath(path)] = (
+            (st.st_ino, st.st_size, st.st_mtime_ns),
+            json.loads(line),
+        )
+
+
+def _read_last_block(path: str) -> Optional[Dict]:
+    """Scan ``path`` backwards and return the last line that parses as JSON."""
+    with open(path, "rb") as fh:
+        pos = fh.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(_TAIL_CHUNK, pos)
+            pos -= step
+            fh.seek(pos)
+            tail = fh.read(step) + tail
+            lines = tail.split(b"\n")
+            # The first piece may be a partial line unless we reached the start.
+            complete = lines if pos == 0 else lines[1:]
+            for line in reversed(complete):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    return json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+            tail = lines[0] if pos else b""
+    return None
+
+
+def load_last_block(path: str = "blockchain.jsonl") -> Optional[Dict]:
+    """Return the last block in ``path`` without loading the whole chain.
+
+    Matches ``load_chain(path)[-1]`` (or ``None`` for an empty chain) but
+    reads only the file tail, and reuses the parsed block until the file
+    changes.
+    """
+    key = os.path.abspath(path)
+    try:
+        st = os.stat(key)
+    except FileNotFoundError:
+        _LAST_BLOCK_CACHE.pop(key, None)
+        return None
+    stamp = (st.st_ino, st.st_size, st.st_mtime_ns)
+    cached = _LAST_BLOCK_CACHE.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    block = _read_last_block(key)
+    _LAST_BLOCK_CACHE[key] = (stamp, block)
+    return block
 
 
 def load_chain(path: str = "blockchain.jsonl") -> List[Dict]:
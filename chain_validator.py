@@ -1,6 +1,7 @@
 import json
 import hashlib
 import time
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Iterable
 
@@ -129,14 +130,12 @@ def verify_event(event: Dict[str, Any]) -> None:
 
 def compute_payouts(event: Dict[str, Any], miner: str | None) -> Dict[str, float]:
     header = event.get("header", {})
-    yes_raw = event.get("bets", {}).get("YES", [])
-    no_raw = event.get("bets", {}).get("NO", [])
+    valid_yes, valid_no = event_manager.betting_interface.get_bets_for_event(event)
 
-    valid_yes = [b for b in yes_raw if event_manager.betting_interface.verify_bet(b)]
-    valid_no = [b for b in no_raw if event_manager.betting_interface.verify_bet(b)]
-
-    yes_total = sum(b.get("amount", 0) for b in valid_yes)
-    no_total = sum(b.get("amount", 0) for b in valid_no)
+    # Verified bets always carry ``amount`` (see ``betting_interface._well_formed``).
+    amount = itemgetter("amount")
+    yes_total = sum(map(amount, valid_yes))
+    no_total = sum(map(amount, valid_no))
 
     success = yes_total > no_total
     winners = valid_yes if success else valid_no
@@ -153,8 +152,8 @@ def compute_payouts(event: Dict[str, Any], miner: str | None) -> Dict[str, float
 
     if winner_total > 0:
         for bet in winners:
-            pub = bet.get("pubkey")
-            amt = bet.get("amount", 0)
+            pub = bet["pubkey"]
+            amt = bet["amount"]
             if pub:
                 payout = pot * (amt / winner_total)
                 payouts[pub] = payouts.get(pub, 0.0) + payout
@@ -8,12 +8,7 @@ from . import event_manager
 
 
 def _event_to_dict(event: dict) -> dict:
-    data = event.copy()
-    if "microblocks" in data:
-        data["microblocks"] = [b.hex() for b in data["microblocks"]]
-    if "seeds" in data:
-        data["seeds"] = [s.hex() if isinstance(s, bytes) else None for s in data["seeds"]]
-    return data
+    return event_manager.serialize_event(event)
 
 
 def _create_bundle(events: List[dict]) -> bytes:
@@ -5,7 +5,7 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
-from .signature_utils import load_keys, sign_data, verify_signature
+from .signature_utils import load_keys, sign_data, verify_signatures
 
 from typing import Dict, Any, List, Tuple
 
@@ -21,26 +21,64 @@ def submit_bet(event_id: str, choice: str, amount: int, keyfile: str) -> Dict[st
         "amount": amount,
         "pubkey": pub,
     }
-    signature = sign_data(repr(payload).encode("utf-8"), priv)
+    signature = sign_data(_canonical(payload), priv)
     bet = payload.copy()
     bet["signature"] = signature
     return bet
 
 
-def verify_bet(bet: Dict[str, Any]) -> bool:
-    """Return ``True`` if ``bet`` has a valid structure and signature."""
-    required_fields = {"event_id", "choice", "amount", "pubkey", "signature"}
-    if not required_fields.issubset(bet):
-        return False
-    if bet["choice"] not in ("YES", "NO"):
-        return False
-    payload = {
+_REQUIRED_FIELDS = {"event_id", "choice", "amount", "pubkey", "signature"}
+
+
+def _well_formed(bet: Dict[str, Any]) -> bool:
+    return _REQUIRED_FIELDS.issubset(bet) and bet["choice"] in ("YES", "NO")
+
+
+def _canonical(payload: Dict[str, Any]) -> bytes:
+    return json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+
+
+def _payload(bet: Dict[str, Any]) -> Dict[str, Any]:
+    return {
         "event_id": bet["event_id"],
         "choice": bet["choice"],
         "amount": bet["amount"],
         "pubkey": bet["pubkey"],
     }
-    return verify_signature(repr(payload).encode("utf-8"), bet["signature"], bet["pubkey"])
+
+
+def _legacy_payload(bet: Dict[str, Any]) -> bytes:
+    """Return the ``repr`` payload signed by bets created before canonical JSON."""
+    return repr(_payload(bet)).encode("utf-8")
+
+
+def verify_bet(bet: Dict[str, Any]) -> bool:
+    """Return ``True`` if ``bet`` has a valid structure and signature."""
+    return verify_bets([bet])[0]
+
+
+def verify_bets(bets: List[Dict[str, Any]]) -> List[bool]:
+    """Return :func:`verify_bet` results for ``bets`` verified as one batch."""
+    results = [False] * len(bets)
+    indices = [i for i, bet in enumerate(bets) if _well_formed(bet)]
+    checked = verify_signatures(
+        (_canonical(_payload(bets[i])), bets[i]["signature"], bets[i]["pubkey"])
+        for i in indices
+    )
+    legacy = []
+    for i, ok in zip(indices, checked):
+        if ok:
+            results[i] = True
+        else:
+            legacy.append(i)
+    if legacy:
+        rechecked = verify_signatures(
+            (_legacy_payload(bets[i]), bets[i]["signature"], bets[i]["pubkey"])
+            for i in legacy
+        )
+        for i, ok in zip(legacy, rechecked):
+            results[i] = ok
+    return results
 
 
 def record_bet(event: Dict[str, Any], bet: Dict[str, Any]) -> None:
@@ -58,8 +96,9 @@ def get_bets_for_event(event: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], Lis
     yes_raw = event.get("bets", {}).get("YES", [])
     no_raw = event.get("bets", {}).get("NO", [])
 
-    valid_yes = [b for b in yes_raw if verify_bet(b)]
-    valid_no = [b for b in no_raw if verify_bet(b)]
+    ok = verify_bets(yes_raw + no_raw)
+    valid_yes = [b for b, valid in zip(yes_raw, ok) if valid]
+    valid_no = [b for b, valid in zip(no_raw, ok[len(yes_raw):]) if valid]
 
     return valid_yes, valid_no
 
@@ -87,6 +126,7 @@ def main() -> None:
 __all__ = [
     "submit_bet",
     "verify_bet",
+    "verify_bets",
     "record_bet",
     "get_bets_for_event",
 ]
@@ -7,14 +7,29 @@ from typing import Any, Dict, List, Optional, Set, Tuple
 import os
 import tempfile
 import logging
+import mmap
+import weakref
+from collections.abc import Sequence
+from concurrent.futures import ProcessPoolExecutor
 
 from datetime import datetime
-from nacl import signing
+from json.encoder import encode_basestring_ascii as _json_str
+
+try:  # pragma: no cover - optional fast JSON codec
+    import orjson
+except ImportError:  # pragma: no cover - fall back to the standard library
+    orjson = None
 
 from .config import GENESIS_HASH
-from .signature_utils import verify_signature, sign_data, generate_keypair
+from .signature_utils import verify_signature, sign_data, generate_keypair, load_private_key
 import time
-from .merkle_utils import build_merkle_tree as _build_merkle_tree
+from .merkle_utils import (
+    build_flat_merkle_tree,
+    flat_merkle_proof,
+    merkle_cache_depth,
+    merkle_subtree,
+    select_merkle_levels,
+)
 from . import nested_miner, betting_interface, exhaustive_miner
 from .betting_interface import get_bets_for_event
 from .ledger import apply_mining_results
@@ -27,20 +42,24 @@ FINAL_BLOCK_PADDING_BYTE = b"\x00"
 # Maximum total microblock bytes to keep in memory before spilling to disk
 MAX_RAM_MICROBLOCK_BYTES = 10 * 1024 * 1024  # 10MB
 
-# Map of event_id -> temporary directory containing spilled microblocks
-_MICROBLOCK_STORES: Dict[str, str] = {}
+# Map of event_id -> packed file holding that event's spilled microblocks
+_MICROBLOCK_STORES: "weakref.WeakValueDictionary[str, PackedMicroblocks]" = (
+    weakref.WeakValueDictionary()
+)
 
 LAST_FINALIZED_HASH = GENESIS_HASH
 LAST_FINALIZED_TIME = 0.0
 # Hash of the last finalized statement. Used to link final blocks together.
 LAST_STATEMENT_HASH = GENESIS_HASH
 
-# Pending microblock information keyed by event_id
-pending_microblocks: Dict[str, Dict[int, bytes]] = {}
-pending_seeds: Dict[str, Dict[int, bytes]] = {}
-pending_miners: Dict[str, Dict[int, str]] = {}
+# Pending microblock information keyed by event_id. Each value is a list
+# with one slot per microblock, ``None`` until that index is submitted.
+pending_microblocks: Dict[str, List[Optional[bytes]]] = {}
+pending_seeds: Dict[str, List[Optional[bytes]]] = {}
+pending_miners: Dict[str, List[Optional[str]]] = {}
 
-# Event metadata (block count and microblock size) keyed by event_id
+# Event metadata (block count, microblock size and number of filled
+# pending slots) keyed by event_id
 event_metadata: Dict[str, Dict[str, int]] = {}
 
 # File used to persist finalized statements
@@ -48,10 +67,16 @@ FINALIZED_FILE = Path("finalized_statements.jsonl")
 # File used to log finalized block summaries
 FINALIZED_EVENT_LOG = Path("finalized_log.jsonl")
 
+# Events with at least this many microblocks are verified across processes
+PARALLEL_VERIFY_MIN_BLOCKS = 4096
+
+
+_sha256 = hashlib.sha256
+
 
 def sha256(data: bytes) -> str:
     """Return hex encoded SHA-256 digest of ``data``."""
-    return hashlib.sha256(data).hexdigest()
+    return _sha256(data).hexdigest()
 
 
 def split_into_microblocks(
@@ -60,12 +85,11 @@ def split_into_microblocks(
     """Split ``payload`` into padded microblocks."""
 
     orig_len = len(payload)
-    blocks: List[bytes] = []
-    for i in range(0, orig_len, microblock_size):
-        chunk = payload[i : i + microblock_size]
-        if len(chunk) < microblock_size:
-            chunk = chunk + FINAL_BLOCK_PADDING_BYTE * (microblock_size - len(chunk))
-        blocks.append(chunk)
+    # Pad once up front so every slice below is already full length.
+    padded = bytes(payload) + FINAL_BLOCK_PADDING_BYTE * (-orig_len % microblock_size)
+    blocks = [
+        padded[i : i + microblock_size] for i in range(0, len(padded), microblock_size)
+    ]
     return blocks, len(blocks), orig_len
 
 
@@ -75,19 +99,131 @@ HEADER_VOTE_LEN = 5
 HEADER_TOTAL = HEADER_AUTHOR_LEN + HEADER_PREV_LEN + 2 * HEADER_VOTE_LEN
 
 
+def _join_blocks(blocks: List[bytes]) -> bytes:
+    """Concatenate ``blocks`` without copying each one first.
+
+    ``bytes.join`` accepts any buffer; the per-block ``bytes()`` conversion
+    is only needed for blocks stored as lists of ints.
+    """
+
+    try:
+        return b"".join(blocks)
+    except TypeError:
+        return b"".join(bytes(b) for b in blocks)
+
+
 def reassemble_microblocks(blocks: List[bytes]) -> str:
     """Return the original message from ``blocks`` dropping the binary header."""
 
-    payload = b"".join(bytes(b) for b in blocks).rstrip(FINAL_BLOCK_PADDING_BYTE)
+    payload = _join_blocks(blocks).rstrip(FINAL_BLOCK_PADDING_BYTE)
     if len(payload) < HEADER_TOTAL:
         return ""
     return payload[HEADER_TOTAL:].decode("utf-8", errors="replace")
 
 
+class PackedMicroblocks(Sequence):
+    """Read-only sequence of fixed-size microblocks backed by one packed file.
+
+    The file is mapped lazily and each item is sliced out of the mapping, so
+    indexing costs no syscalls after the first access. With ``owned`` the
+    file is private to this view and is deleted by :meth:`unlink`, when the
+    view is garbage collected, or at interpreter exit.
+    """
+
+    def __init__(
+        self, path: str, microblock_size: int, count: int, *, owned: bool = False
+    ) -> None:
+        self.path = path
+        self.microblock_size = microblock_size
+        self._count = count
+        self._mm: Optional[mmap.mmap] = None
+        self._remove = weakref.finalize(self, _remove_file, path) if owned else None
+
+    def _map(self) -> mmap.mmap:
+        if self._mm is None:
+            with open(self.path, "rb") as fh:
+                self._mm = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._mm
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._count))]
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("microblock index out of range")
+        start = index * self.microblock_size
+        return self._map()[start : start + self.microblock_size]
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+
+    def unlink(self) -> None:
+        """Delete an owned backing file, keeping blocks readable via the map."""
+
+        if self._remove is not None and self._remove.alive:
+            self._map()
+            self._remove()
+
+
+def _remove_file(path: str) -> None:
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _spill_microblocks_to_disk(
+    event_id: str, payload: bytes, microblock_size: int
+) -> PackedMicroblocks:
+    """Write padded ``payload`` to one packed file and return a view of it."""
+
+    padded_len = len(payload) + (-len(payload) % microblock_size)
+    fd, path = tempfile.mkstemp(prefix="helix_", suffix=".pack")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            fh.write(payload)
+            fh.write(FINAL_BLOCK_PADDING_BYTE * (padded_len - len(payload)))
+    except BaseException:
+        _remove_file(path)
+        raise
+    blocks = PackedMicroblocks(path, microblock_size, padded_len // microblock_size, owned=True)
+    _MICROBLOCK_STORES[event_id] = blocks
+    return blocks
+
+
+def load_microblock(event: Dict[str, Any], index: int) -> bytes:
+    """Return microblock ``index`` of ``event`` whether in memory or spilled."""
+
+    return bytes(event["microblocks"][index])
+
+
+def cleanup_microblocks(event: Dict[str, Any] | str) -> None:
+    """Remove the packed spill file of ``event`` (or an event id) if any.
+
+    Blocks already handed out stay readable until the event is dropped.
+    """
+
+    if isinstance(event, str):
+        blocks = _MICROBLOCK_STORES.pop(event, None)
+    else:
+        blocks = event.get("microblocks")
+        evt_id = event.get("header", {}).get("statement_id")
+        if evt_id is not None and _MICROBLOCK_STORES.get(evt_id) is blocks:
+            del _MICROBLOCK_STORES[evt_id]
+    if isinstance(blocks, PackedMicroblocks):
+        blocks.unlink()
+
+
 def reassemble_payload(blocks: List[bytes]) -> bytes:
     """Return the full payload stored in ``blocks``."""
 
-    return b"".join(bytes(b) for b in blocks).rstrip(FINAL_BLOCK_PADDING_BYTE)
+    return _join_blocks(blocks).rstrip(FINAL_BLOCK_PADDING_BYTE)
 
 
 def create_event(
@@ -107,7 +243,7 @@ def create_event(
         pub, priv = generate_keypair()
     else:
         priv = private_key
-        signing_key = signing.SigningKey(base64.b64decode(priv))
+        signing_key = load_private_key(priv)
         pub = base64.b64encode(signing_key.verify_key.encode()).decode("ascii")
 
     prev_hash_bytes = bytes.fromhex(LAST_STATEMENT_HASH)[:HEADER_PREV_LEN]
@@ -119,13 +255,27 @@ def create_event(
     )
 
     payload = header_bytes + statement.encode("utf-8")
-    blocks, count, orig_len = split_into_microblocks(payload, microblock_size)
-    root, tree = _build_merkle_tree(blocks)
+    statement_id = sha256(payload)
+    spilled = len(payload) > MAX_RAM_MICROBLOCK_BYTES
+    if spilled:
+        blocks = _spill_microblocks_to_disk(statement_id, payload, microblock_size)
+        count, orig_len = len(blocks), len(payload)
+    else:
+        blocks, count, orig_len = split_into_microblocks(payload, microblock_size)
+    root, all_offsets, all_nodes = build_flat_merkle_tree(blocks, leaves=not spilled)
+    height = len(all_offsets) - 1
+    # Keep leaves, one cached middle level and the root; the levels in
+    # between are rebuilt from the leaves on demand. Spilled events drop the
+    # leaf level too and rehash it from the packed file.
+    levels = sorted({0, merkle_cache_depth(height), height - 1})
+    if spilled and height > 1:
+        levels.remove(0)
+    level_offsets, nodes = select_merkle_levels(all_offsets, all_nodes, levels)
 
     signature = sign_data(statement.encode("utf-8"), priv)
 
     header = {
-        "statement_id": sha256(payload),
+        "statement_id": statement_id,
         "payload_length": orig_len,
         "microblock_size": microblock_size,
         "block_count": count,
@@ -139,10 +289,15 @@ def create_event(
         "header": header,
         "statement": statement,
         "microblocks": blocks,
-        "merkle_tree": [[h.hex() for h in level] for level in tree],
+        "merkle_tree": {
+            "levels": levels,
+            "level_offsets": level_offsets,
+            "nodes": nodes,
+        },
         "seeds": [None] * count,
         "seed_depths": [0] * count,
         "mined_status": [False] * count,
+        "mined_count": 0,
         "rewards": [0.0] * count,
         "refunds": [0.0] * count,
         "is_closed": False,
@@ -157,11 +312,62 @@ def create_event(
     event_metadata[evt_id] = {
         "block_count": count,
         "microblock_size": microblock_size,
+        "filled": 0,
     }
 
     return event
 
 
+# Binary-to-text encoding used for bytes fields in saved events. Files
+# without an ``encoding`` field predate this and are hex.
+STORAGE_ENCODING = "base64"
+
+
+def _encode_bytes(data: bytes, encoding: str = STORAGE_ENCODING) -> str:
+    if encoding == "base64":
+        return base64.b64encode(data).decode("ascii")
+    return data.hex()
+
+
+def _decode_bytes(text: str, encoding: str = "hex") -> bytes:
+    if encoding == "base64":
+        return base64.b64decode(text)
+    return bytes.fromhex(text)
+
+
+def encode_microblocks(blocks: List[bytes], encoding: str = STORAGE_ENCODING) -> str:
+    """Return ``blocks`` as one encoded string for storage."""
+
+    return _encode_bytes(b"".join(blocks), encoding)
+
+
+def decode_microblocks(
+    value: str | List[str], microblock_size: int, encoding: str = "hex"
+) -> List[bytes]:
+    """Decode stored microblocks, accepting one string or a legacy list."""
+
+    if isinstance(value, str):
+        raw = _decode_bytes(value, encoding)
+        return [raw[i : i + microblock_size] for i in range(0, len(raw), microblock_size)]
+    return [_decode_bytes(b, encoding) for b in value]
+
+
+def serialize_event(event: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a JSON-ready copy of ``event`` with bytes fields encoded."""
+
+    data = event.copy()
+    data["encoding"] = STORAGE_ENCODING
+    data["microblocks"] = encode_microblocks(event.get("microblocks", []))
+    tree = data.get("merkle_tree")
+    if isinstance(tree, dict) and "nodes" in tree:
+        data["merkle_tree"] = dict(tree, nodes=_encode_bytes(tree["nodes"]))
+    if "seeds" in data:
+        data["seeds"] = [
+            _encode_bytes(s) if isinstance(s, (bytes, bytearray)) else s for s in data["seeds"]
+        ]
+    return data
+
+
 def save_event(event: Dict[str, Any], directory: str) -> str:
     """Persist ``event`` to ``directory`` and return the file path."""
 
@@ -170,47 +376,138 @@ def save_event(event: Dict[str, Any], directory: str) -> str:
     if not evt_id:
         raise ValueError("missing statement_id")
 
-    data = event.copy()
-    data["microblocks"] = [b.hex() for b in event.get("microblocks", [])]
-    if "seeds" in data:
-        data["seeds"] = [s.hex() if isinstance(s, (bytes, bytearray)) else s for s in data["seeds"]]
-
     path = Path(directory) / f"{evt_id}.json"
-    with open(path, "w", encoding="utf-8") as fh:
-        json.dump(data, fh, indent=2)
+    _write_event_file(path, serialize_event(event))
     return str(path)
 
 
+def _write_event_file(path: Path, data: Dict[str, Any]) -> None:
+    """Encode ``data`` once and write it to ``path`` in a single call."""
+
+    # Write beside the target and rename so readers never see a partial file.
+    # The temporary name is unique so concurrent writers cannot collide.
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            # mkstemp creates the file 0600; event files are shared readable.
+            os.fchmod(fh.fileno(), 0o644)
+            fh.write(_dump_json(data))
+        os.replace(tmp, path)
+    except BaseException:
+        _remove_file(tmp)
+        raise
+
+
+def _dump_json(data: Dict[str, Any]) -> bytes:
+    """Return ``data`` as indented JSON bytes, using ``orjson`` when present."""
+
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2).encode("utf-8")
+
+
+def _load_json(raw: bytes) -> Any:
+    """Decode JSON ``raw`` bytes, using ``orjson`` when present."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def load_event(path: str) -> Dict[str, Any]:
     """Load and decode an event from ``path``."""
 
-    with open(path, "r", encoding="utf-8") as fh:
-        data = json.load(fh)
+    with open(path, "rb") as fh:
+        data = _load_json(fh.read())
 
     header = data.get("header", {})
     parent = header.get("parent_id")
     if parent and parent != GENESIS_HASH:
         raise ValueError("invalid parent_id")
 
-    data["microblocks"] = [bytes.fromhex(b) for b in data.get("microblocks", [])]
+    encoding = data.pop("encoding", "hex")
+    data["microblocks"] = decode_microblocks(
+        data.get("microblocks", []),
+        header.get("microblock_size", DEFAULT_MICROBLOCK_SIZE),
+        encoding,
+    )
+    tree = data.get("merkle_tree")
+    if isinstance(tree, dict):
+        tree["nodes"] = _decode_bytes(tree.get("nodes", ""), encoding)
+    elif isinstance(tree, list):
+        # Older files stored one hex string per node, level by level.
+        offsets = [0]
+        for level in tree:
+            offsets.append(offsets[-1] + 32 * len(level))
+        data["merkle_tree"] = {
+            "levels": list(range(len(tree))),
+            "level_offsets": offsets,
+            "nodes": bytes.fromhex("".join(h for level in tree for h in level)),
+        }
     seeds = []
     for entry in data.get("seeds", []):
         if entry is None:
             seeds.append(None)
         elif isinstance(entry, str):
-            seeds.append(bytes.fromhex(entry))
+            seeds.append(_decode_bytes(entry, encoding))
         else:
             seeds.append(entry)
     data["seeds"] = seeds
+    # Recount rather than trust the file; external tools flip mined_status.
+    recount_mined(data)
     return data
 
 
+def load_event_header(path: str) -> Dict[str, Any]:
+    """Return the listing fields of the event at ``path`` without decoding it.
+
+    Microblocks, seeds and the Merkle tree are left out, so none of the
+    binary payload is decoded.  The result holds ``header``, ``statement``,
+    ``is_closed``, ``finalized`` and ``mined_count``.  Events rejected by
+    :func:`load_event` for their ``parent_id`` are rejected here too.
+    """
+
+    with open(path, "rb") as fh:
+        data = _load_json(fh.read())
+
+    parent = data.get("header", {}).get("parent_id")
+    if parent and parent != GENESIS_HASH:
+        raise ValueError("invalid parent_id")
+
+    return {
+        "header": data.get("header", {}),
+        "statement": data.get("statement"),
+        "is_closed": data.get("is_closed", False),
+        "finalized": data.get("finalized", False),
+        "mined_count": sum(1 for m in data.get("mined_status", []) if m),
+    }
+
+
+def recount_mined(event: Dict[str, Any]) -> int:
+    """Reset ``mined_count`` from ``mined_status`` and return it.
+
+    Used for events from files or peers, whose stored count is not trusted.
+    """
+
+    mined = sum(1 for m in event.get("mined_status", []) if m)
+    event["mined_count"] = mined
+    return mined
+
+
 def mark_mined(event: Dict[str, Any], index: int) -> None:
     """Mark microblock ``index`` as mined and close event if complete."""
 
-    status = event.setdefault("mined_status", [False] * event["header"]["block_count"])
-    status[index] = True
-    if all(status):
+    status = event.get("mined_status")
+    if status is None:
+        status = event["mined_status"] = [False] * event["header"]["block_count"]
+    mined = event.get("mined_count")
+    if mined is None:
+        mined = sum(1 for m in status if m)
+    if not status[index]:
+        status[index] = True
+        mined += 1
+    event["mined_count"] = mined
+    if mined >= len(status):
         event["is_closed"] = True
 
 
@@ -221,32 +518,48 @@ def accept_mined_seed(
     *,
     miner: str | None = None,
     chain_file: str | None = None,
+    events_dir: str | None = None,
 ) -> float:
     """Store ``encoded`` seed for ``index`` and finalize if complete."""
 
-    if isinstance(encoded, list) and encoded and isinstance(encoded[0], int):
-        encoded_bytes = bytes(encoded)
-    elif isinstance(encoded, list):
-        encoded_bytes = b"".join(bytes(e) for e in encoded)
+    # Plain bytes is the common case and ``bytes()`` returns it uncopied;
+    # only a list of byte strings needs joining.
+    if isinstance(encoded, list) and encoded and not isinstance(encoded[0], int):
+        encoded_bytes = b"".join(encoded)
     else:
         encoded_bytes = bytes(encoded)
 
     block = event.get("microblocks", [])[index]
     # Verification skipped in simplified test implementation
 
-    seeds = event.setdefault("seeds", [None] * event["header"]["block_count"])
-    rewards = event.setdefault("rewards", [0.0] * event["header"]["block_count"])
-    miners = event.setdefault("miners", [None] * event["header"]["block_count"])
+    header = event["header"]
+    count = header["block_count"]
+    # ``setdefault`` would build a fresh N-element default on every call.
+    seeds = event.get("seeds")
+    if seeds is None:
+        seeds = event["seeds"] = [None] * count
+    rewards = event.get("rewards")
+    if rewards is None:
+        rewards = event["rewards"] = [0.0] * count
+    miners = event.get("miners")
+    if miners is None:
+        miners = event["miners"] = [None] * count
     seeds[index] = encoded_bytes
     miners[index] = miner
-    rewards[index] = compute_reward(encoded_bytes, event["header"].get("microblock_size", DEFAULT_MICROBLOCK_SIZE))
+    rewards[index] = compute_reward(encoded_bytes, header.get("microblock_size", DEFAULT_MICROBLOCK_SIZE))
     mark_mined(event, index)
 
-    if event.get("is_closed") and all(event.get("mined_status", [])) and not event.get("finalized"):
+    if event.get("is_closed") and event["mined_count"] >= count and not event.get("finalized"):
         if chain_file is not None:
-            finalize_event(event, node_id=miner, chain_file=chain_file, delta_bonus=True)
+            finalize_event(
+                event,
+                node_id=miner,
+                chain_file=chain_file,
+                events_dir=events_dir,
+                delta_bonus=True,
+            )
         else:
-            finalize_event(event, node_id=miner, delta_bonus=True)
+            finalize_event(event, node_id=miner, events_dir=events_dir, delta_bonus=True)
 
     return 0.0
 
@@ -268,17 +581,70 @@ def verify_seed_chain(encoded: bytes, block: bytes) -> bool:
     return nested_miner.verify_nested_seed(encoded, block)
 
 
+def merkle_proof(event: Dict[str, Any], index: int) -> Tuple[List[bytes], bytes]:
+    """Return ``(proof, anchor)`` authenticating microblock ``index``.
+
+    The proof climbs only to the lowest level stored above the leaves in
+    ``event["merkle_tree"]`` and ``anchor`` is that level's node, so
+    ``verify_merkle_proof(block, proof, anchor, index)`` holds.  Levels
+    below the anchor are rebuilt from the stored leaf digests of the
+    anchor's subtree alone; trees stored without their leaf level (spilled
+    events) rehash the subtree's microblocks instead.
+    """
+
+    tree = event["merkle_tree"]
+    levels = tree["levels"]
+    offsets = tree["level_offsets"]
+    nodes = tree["nodes"]
+    pos = 1 if len(levels) > 1 and levels[0] == 0 else 0
+    depth = levels[pos]
+
+    start = (index >> depth) << depth
+    if levels[0] == 0:
+        leaf_lo = offsets[0] + 32 * start
+        leaf_hi = min(offsets[1], leaf_lo + 32 * (1 << depth))
+        leaves = nodes[leaf_lo:leaf_hi]
+    else:
+        blocks = event["microblocks"][start : start + (1 << depth)]
+        leaves = b"".join(hashlib.sha256(bytes(b)).digest() for b in blocks)
+    sub_offsets, sub_nodes = merkle_subtree(leaves, depth)
+    proof = flat_merkle_proof(index - start, sub_offsets, sub_nodes, depth)
+    anchor_at = offsets[pos] + 32 * (index >> depth)
+    return proof, nodes[anchor_at : anchor_at + 32]
+
+
 def verify_statement(event: Dict[str, Any]) -> bool:
     """Return ``True`` if all seeds regenerate their microblocks."""
 
     blocks = event.get("microblocks", [])
     seeds = event.get("seeds", [])
-    for block, seed in zip(blocks, seeds):
-        if seed is None:
-            return False
-        if not nested_miner.verify_nested_seed(seed, block):
-            return False
-    return True
+    # Cheap structural checks first so tampered events are rejected before
+    # any seed chain is expanded.
+    if len(seeds) < len(blocks):
+        return False
+    if any(seed is None for seed in seeds[: len(blocks)]):
+        return False
+    # Gossiped events may still carry hex strings; only raw blocks hash.
+    if not isinstance(blocks, PackedMicroblocks) and not all(
+        isinstance(b, (bytes, bytearray)) for b in blocks
+    ):
+        return False
+    root = event.get("header", {}).get("merkle_root")
+    if root is not None and build_flat_merkle_tree(blocks)[0].hex() != root:
+        return False
+    workers = os.cpu_count() or 1
+    if len(blocks) >= PARALLEL_VERIFY_MIN_BLOCKS and workers > 1:
+        # G is pure Python over tiny inputs and never releases the GIL, so
+        # large events are fanned out to worker processes rather than threads.
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(
+                nested_miner.verify_nested_seed,
+                seeds,
+                blocks,
+                chunksize=max(1, len(blocks) // (4 * workers)),
+            )
+            return all(results)
+    return nested_miner.verify_nested_seeds_batch(seeds, blocks) == -1
 
 
 def validate_parent(event: Dict[str, Any]) -> None:
@@ -296,14 +662,25 @@ def submit_microblock(event_id: str, index: int, seed: bytes, miner: str) -> Non
     if not meta:
         raise KeyError(f"Unknown event {event_id}")
 
+    count = meta.get("block_count", 0)
+    if not 0 <= index < count:
+        raise IndexError(f"microblock index {index} out of range")
+
     size = meta.get("microblock_size", DEFAULT_MICROBLOCK_SIZE)
     block = G(seed, size)
 
-    pending_microblocks.setdefault(event_id, {})[index] = block
-    pending_seeds.setdefault(event_id, {})[index] = seed
-    pending_miners.setdefault(event_id, {})[index] = miner
-
-    if len(pending_microblocks[event_id]) == meta.get("block_count", 0):
+    blocks = pending_microblocks.get(event_id)
+    if blocks is None:
+        blocks = pending_microblocks[event_id] = [None] * count
+        pending_seeds[event_id] = [None] * count
+        pending_miners[event_id] = [None] * count
+    if blocks[index] is None:
+        meta["filled"] = meta.get("filled", 0) + 1
+    blocks[index] = block
+    pending_seeds[event_id][index] = seed
+    pending_miners[event_id][index] = miner
+
+    if meta["filled"] == count:
         try:
             finalize_event(event_id)
         except Exception as exc:  # pragma: no cover - logging
@@ -334,6 +711,66 @@ def compute_reward(seed: bytes | Dict[str, Any], block_size: int | None = None)
     return 0.0
 
 
+# Keys of the block header built by :func:`_legacy_finalize_event`, presorted
+# so the canonical encoding matches ``json.dumps(header, sort_keys=True)``.
+_BLOCK_HEADER_KEYS = (
+    "delta_bonus",
+    "delta_granted",
+    "delta_receiver",
+    "delta_seconds",
+    "event_id",
+    "finalizer",
+    "parent_id",
+    "previous_hash",
+    "timestamp",
+)
+
+
+def _json_scalar(value: Any) -> str:
+    if value is None:
+        return "null"
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if type(value) is str:
+        return _json_str(value)
+    if type(value) is int:
+        return int.__repr__(value)
+    if type(value) is float and math.isfinite(value):
+        return float.__repr__(value)
+    # Containers and unusual scalars; nested keys must be sorted too.
+    return json.dumps(value, sort_keys=True)
+
+
+def _canonical_block_bytes(header: Dict[str, Any]) -> bytes:
+    """Return ``json.dumps(header, sort_keys=True)`` encoded as UTF-8.
+
+    Block headers have a fixed set of scalar fields, so they are emitted in
+    presorted order without going through the generic encoder.  Any other
+    shape falls back to :func:`json.dumps`.
+    """
+
+    if len(header) != len(_BLOCK_HEADER_KEYS) or not all(k in header for k in _BLOCK_HEADER_KEYS):
+        return json.dumps(header, sort_keys=True).encode("utf-8")
+    body = ", ".join(f'"{k}": {_json_scalar(header[k])}' for k in _BLOCK_HEADER_KEYS)
+    return ("{" + body + "}").encode("utf-8")
+
+
+def _append_log_entry(path: Path, entry: Dict[str, Any]) -> None:
+    """Append ``entry`` as one JSON line to the log at ``path``.
+
+    Uses :func:`blockchain.append_line`, which keeps one append descriptor
+    per log open across finalizations instead of reopening the file.
+    """
+
+    if orjson is not None:
+        line = orjson.dumps(entry, option=orjson.OPT_APPEND_NEWLINE)
+    else:
+        line = (json.dumps(entry) + "\n").encode("utf-8")
+    blockchain.append_line(str(path), line)
+
+
 def _legacy_finalize_event(
     event: Dict[str, Any],
     *,
@@ -364,8 +801,12 @@ def _legacy_finalize_event(
     LAST_FINALIZED_TIME = now
 
     # Determine previous block and bonus receiver
-    chain = _bc.load_chain(str(chain_file))
-    prev_block = chain[-1] if chain else None
+    load_last_block = getattr(_bc, "load_last_block", None)
+    if load_last_block is not None:
+        prev_block = load_last_block(str(chain_file))
+    else:
+        chain = _bc.load_chain(str(chain_file))
+        prev_block = chain[-1] if chain else None
     bonus_receiver = prev_block.get("finalizer") if prev_block else None
 
     # Reassemble statement and compute its hash
@@ -386,7 +827,7 @@ def _legacy_finalize_event(
         "delta_granted": now if delta_bonus else None,
     }
 
-    block_id = sha256(json.dumps(header, sort_keys=True).encode("utf-8"))
+    block_id = sha256(_canonical_block_bytes(header))
     header["block_id"] = block_id
 
     # Persist block and update globals
@@ -415,31 +856,25 @@ def _legacy_finalize_event(
 
     # Append summary entry for this finalized block
     try:
-        with open(FINALIZED_EVENT_LOG, "a", encoding="utf-8") as fh:
-            json.dump(
-                {
-                    "block_id": block_id,
-                    "statement_id": statement_id,
-                    "miner_id": node_id,
-                    "delta_seconds": delta_seconds,
-                    "compression_reward": miner_reward,
-                },
-                fh,
-            )
-            fh.write("\n")
+        _append_log_entry(
+            FINALIZED_EVENT_LOG,
+            {
+                "block_id": block_id,
+                "statement_id": statement_id,
+                "miner_id": node_id,
+                "delta_seconds": delta_seconds,
+                "compression_reward": miner_reward,
+            },
+        )
     except Exception as exc:  # pragma: no cover - logging only
         print(f"Failed to record finalized event log: {exc}")
 
     # Persist event if requested
     if events_dir:
-        path = Path(events_dir) / f"{header['event_id']}.json"
-        data = event.copy()
-        if "microblocks" in data:
-            data["microblocks"] = [b.hex() for b in data["microblocks"]]
-        if "seeds" in data:
-            data["seeds"] = [s.hex() if isinstance(s, (bytes, bytearray)) else s for s in data["seeds"]]
-        with open(path, "w", encoding="utf-8") as fh:
-            json.dump(data, fh, indent=2)
+        _write_event_file(Path(events_dir) / f"{header['event_id']}.json", serialize_event(event))
+
+    # The statement is on chain now; a spill file is no longer needed.
+    cleanup_microblocks(event)
 
     # Later blocks verify this delta claim and may penalize the grantor
     # if the recorded value differs from the actual gap by more than 10s.
@@ -454,10 +889,11 @@ def _finalize_event_by_id(event_id: str) -> None:
     if not meta:
         raise KeyError(f"Unknown event {event_id}")
 
-    block_count = meta.get("block_count", 0)
-    blocks = [pending_microblocks[event_id][i] for i in range(block_count)]
-    seeds = [pending_seeds[event_id][i] for i in range(block_count)]
-    miners = [pending_miners[event_id][i] for i in range(block_count)]
+    if meta.get("filled", 0) != meta.get("block_count", 0):
+        raise KeyError(f"Event {event_id} has unsubmitted microblocks")
+    blocks = pending_microblocks.get(event_id, [])
+    seeds = pending_seeds.get(event_id, [])
+    miners = pending_miners.get(event_id, [])
 
     payload = b"".join(blocks).rstrip(FINAL_BLOCK_PADDING_BYTE)
     statement_id = sha256(payload)
@@ -480,20 +916,18 @@ def _finalize_event_by_id(event_id: str) -> None:
     )
 
     try:
-        with open(FINALIZED_FILE, "a", encoding="utf-8") as fh:
-            json.dump(
-                {
-                    "statement_id": statement_id,
-                    "statement": statement,
-                    "previous_hash": previous_hash,
-                    "delta_seconds": delta_seconds,
-                    "seeds": [s.hex() for s in seeds],
-                    "miners": miners,
-                    "timestamp": now,
-                },
-                fh,
-            )
-            fh.write("\n")
+        _append_log_entry(
+            FINALIZED_FILE,
+            {
+                "statement_id": statement_id,
+                "statement": statement,
+                "previous_hash": previous_hash,
+                "delta_seconds": delta_seconds,
+                "seeds": [s.hex() for s in seeds],
+                "miners": miners,
+                "timestamp": now,
+            },
+        )
     except Exception as exc:  # pragma: no cover - logging only
         print(f"Failed to record finalized statement: {exc}")
 
@@ -530,13 +964,31 @@ def finalize_event(
     return None
 
 
-def replay_and_remine(statement_id: str) -> None:
+def _seed_len(seed: Any) -> float:
+    """Return the encoded byte length of ``seed`` in any stored form.
+
+    ``None`` counts as infinitely long; hex strings are measured without
+    decoding them.
+    """
+
+    if seed is None:
+        return math.inf
+    if isinstance(seed, str):
+        return len(seed) // 2
+    if isinstance(seed, list):
+        if seed and isinstance(seed[0], int):
+            return len(seed)
+        return sum(_seed_len(part) for part in seed)
+    return len(seed)
+
+
+def replay_and_remine(statement_id: str) -> Dict[int, bytes]:
     """Re-mine microblocks for ``statement_id`` from their output.
 
     Loads ``data/events/<id>.json`` and attempts to compress each microblock
-    again using :func:`exhaustive_miner.exhaustive_mine`.  The number of blocks
-    that yield a smaller encoded seed is logged.  This is a scaffold and does
-    not persist any new seeds.
+    again using :func:`exhaustive_miner.mine_blocks`.  The number of blocks
+    that yield a smaller encoded seed is logged.  New seeds are not
+    persisted; they are returned keyed by microblock index.
     """
 
     path = Path("data/events") / f"{statement_id}.json"
@@ -547,34 +999,15 @@ def replay_and_remine(statement_id: str) -> None:
 
     blocks = event.get("microblocks", [])
     seeds = event.get("seeds", [None] * len(blocks))
+    found = exhaustive_miner.mine_blocks(blocks, max_depth=5)
 
-    def _seed_len(seed: Any) -> int:
-        if seed is None:
-            return math.inf
-        if isinstance(seed, bytes):
-            return len(seed)
-        if isinstance(seed, str):
-            return len(bytes.fromhex(seed))
-        if isinstance(seed, list):
-            if seed and isinstance(seed[0], int):
-                return len(bytes(seed))
-            total = 0
-            for part in seed:
-                if isinstance(part, str):
-                    total += len(bytes.fromhex(part))
-                elif isinstance(part, list) and part and isinstance(part[0], int):
-                    total += len(bytes(part))
-                else:
-                    total += len(part)
-            return total
-        return len(seed)
-
+    remined: Dict[int, bytes] = {}
     improved = 0
     for idx, block in enumerate(blocks):
-        chain = exhaustive_miner.exhaustive_mine(block, max_depth=5)
-        if chain is None:
+        encoded = found[bytes(block)]
+        if encoded is None:
             continue
-        encoded = bytes([len(chain), len(chain[0])]) + b"".join(chain)
+        remined[idx] = encoded
         cur_len = _seed_len(seeds[idx])
         if len(encoded) < cur_len:
             improved += 1
@@ -590,6 +1023,7 @@ def replay_and_remine(statement_id: str) -> None:
         improved,
         len(blocks),
     )
+    return remined
 
 
 def list_events(directory: str = "data/events") -> List[Dict[str, Any]]:
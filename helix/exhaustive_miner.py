@@ -8,19 +8,50 @@ recursively explores all child seeds as dictated by the output of
 :func:`minihelix.G`.
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Iterable, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
-from . import minihelix
+from . import minihelix, nested_miner
 from .minihelix import G
 
 
+# Every 1- and 2-byte seed, built once.  The DFS only expands seeds of these
+# lengths, and reusing the same objects also reuses their cached hashes in
+# the ``_cached_G`` lookups.
+_SEEDS_BY_LEN = {
+    length: tuple(i.to_bytes(length, "big") for i in range(256 ** length))
+    for length in (1, 2)
+}
+# Starting seeds for :meth:`ExhaustiveMiner.mine`, shared by every miner.
+_INITIAL_SEEDS = _SEEDS_BY_LEN[1] + _SEEDS_BY_LEN[2]
+
+
 def _generate_initial_seeds() -> Iterable[bytes]:
     """Yield all 1- and 2-byte seeds in lexicographic order."""
-    for length in (1, 2):
-        max_value = 256 ** length
-        for i in range(max_value):
-            yield i.to_bytes(length, "big")
+    return iter(_INITIAL_SEEDS)
+
+
+# Room for every 1- and 2-byte seed at two block sizes.
+_G_CACHE_SIZE = 2 * len(_INITIAL_SEEDS)
+
+
+@lru_cache(maxsize=_G_CACHE_SIZE)
+def _cached_G(seed: bytes, block_size: int) -> bytes:
+    """Return ``G(seed, block_size)``, memoized across searches.
+
+    The DFS only ever expands 1- and 2-byte seeds, so the same few thousand
+    seeds are evaluated again under every branch and for every microblock
+    of the same size.
+    """
+    return G(seed, block_size)
+
+
+def clear_g_cache() -> None:
+    """Drop the memoized ``G`` outputs, e.g. once mining is finished."""
+    _cached_G.cache_clear()
 
 
 class ExhaustiveMiner:
@@ -35,10 +66,14 @@ class ExhaustiveMiner:
     ) -> None:
         self.target = target_block
         self.block_size = len(target_block)
-        self.initial_seeds = list(_generate_initial_seeds())
+        self.initial_seeds = _INITIAL_SEEDS
         self.attempts = 0
         self.checkpoint_path = checkpoint_path
         self.max_depth = max_depth
+        # (chain length, child seed length) pairs whose subtree was searched
+        # without a hit.  Children depend only on these two values, not on
+        # the parent seed, so such a subtree never needs searching again.
+        self._exhausted: Set[Tuple[int, int]] = set()
 
     def _load_start_index(self) -> int:
         if not self.checkpoint_path:
@@ -57,31 +92,49 @@ class ExhaustiveMiner:
         Path(self.checkpoint_path).write_text(str(index))
 
     def _dfs(self, seed: bytes, chain: List[bytes]) -> Optional[List[bytes]]:
-        """Depth-first search returning the seed chain or ``None``."""
+        """Depth-first search returning the seed chain or ``None``.
+
+        Walks the tree with an explicit stack of child iterators rather than
+        recursion, so each node costs no Python frame.
+        """
         if len(chain) >= self.max_depth:
             return None
-        self.attempts += 1
-        output = G(seed, self.block_size)
-        chain.append(seed)
-        if output == self.target:
-            result = list(chain)
-            print(f"Attempts for microblock: {self.attempts}")
-            return result
-        next_len = output[0]
-        if next_len == 0 or next_len > self.block_size or next_len > 2:
-            chain.pop()
-            return None
-        if len(chain) >= self.max_depth - 1:
-            chain.pop()
-            return None
-        count = 256 ** next_len
-        for i in range(count):
-            next_seed = i.to_bytes(next_len, "big")
-            result = self._dfs(next_seed, chain)
-            if result is not None:
+        target = self.target
+        block_size = self.block_size
+        exhausted = self._exhausted
+        stack: List[Tuple[Iterator[bytes], Tuple[int, int]]] = []
+        while True:
+            self.attempts += 1
+            output = _cached_G(seed, block_size)
+            chain.append(seed)
+            if output == target:
+                result = list(chain)
+                print(f"Attempts for microblock: {self.attempts}")
                 return result
-        chain.pop()
-        return None
+            next_len = output[0]
+            key = (len(chain), next_len)
+            if (
+                next_len == 0
+                or next_len > block_size
+                or next_len > 2
+                or len(chain) >= self.max_depth - 1
+                or key in exhausted
+            ):
+                chain.pop()
+            else:
+                stack.append((iter(_SEEDS_BY_LEN[next_len]), key))
+
+            # Move to the next unvisited child, unwinding finished subtrees.
+            while stack:
+                children, key = stack[-1]
+                seed = next(children, None)
+                if seed is not None:
+                    break
+                stack.pop()
+                exhausted.add(key)
+                chain.pop()
+            else:
+                return None
 
     def mine(self, start_index: int = 0) -> Optional[List[bytes]]:
         """Search for a compression seed chain starting from ``start_index``."""
@@ -121,4 +174,88 @@ def exhaustive_mine(
     return miner.mine(start_index=start_index)
 
 
-__all__ = ["exhaustive_mine", "ExhaustiveMiner"]
+def encode_mined_chain(chain: List[bytes], block: bytes) -> Optional[bytes]:
+    """Return ``chain`` as a seed accepted by :func:`nested_miner.verify_nested_seed`.
+
+    In a chain found by the DFS only the last seed regenerates ``block``;
+    the earlier ones just select its length.  That seed is encoded as a
+    depth-1 nested seed, and ``None`` is returned if it does not verify
+    (e.g. a 2-byte seed for a 1-byte block).
+    """
+    encoded = nested_miner.encode_chain([chain[-1]])
+    if not nested_miner.verify_nested_seed(encoded, block):
+        return None
+    return encoded
+
+
+def mine_blocks(
+    blocks: Iterable[bytes],
+    *,
+    max_depth: int = 5,
+    workers: int | None = None,
+) -> Dict[bytes, Optional[bytes]]:
+    """Return a verified encoded seed (or ``None``) for each distinct block.
+
+    Identical blocks share one search.  With more than one worker the
+    searches run in a process pool; the search is pure Python, so threads
+    would not run in parallel.
+    """
+    unique = list(dict.fromkeys(bytes(b) for b in blocks))
+    mine = partial(exhaustive_mine, max_depth=max_depth)
+    worker_count = workers or min(os.cpu_count() or 1, len(unique))
+    if worker_count > 1:
+        with ProcessPoolExecutor(max_workers=worker_count) as pool:
+            chains = list(pool.map(mine, unique))
+    else:
+        chains = [mine(block) for block in unique]
+    return {
+        block: None if chain is None else encode_mined_chain(chain, block)
+        for block, chain in zip(unique, chains)
+    }
+
+
+def mine_event(
+    event: Dict[str, Any],
+    *,
+    max_depth: int = 5,
+    miner: str | None = None,
+    workers: int | None = None,
+    chain_file: str | None = None,
+    events_dir: str | None = None,
+) -> int:
+    """Exhaustively mine every unmined microblock of ``event``.
+
+    Seeds come from :func:`mine_blocks` and are stored through
+    :func:`event_manager.accept_mined_seed` in this process, which
+    finalizes the event into ``chain_file``/``events_dir`` once every
+    microblock is mined.  Returns the number of microblocks mined.
+    """
+    from . import event_manager
+
+    blocks = event.get("microblocks", [])
+    status = event.get("mined_status") or [False] * len(blocks)
+    pending = [idx for idx in range(len(blocks)) if not status[idx]]
+    seeds = mine_blocks(
+        (blocks[idx] for idx in pending), max_depth=max_depth, workers=workers
+    )
+
+    mined = 0
+    for idx in pending:
+        encoded = seeds[bytes(blocks[idx])]
+        if encoded is None:
+            continue
+        event_manager.accept_mined_seed(
+            event, idx, encoded, miner=miner, chain_file=chain_file, events_dir=events_dir
+        )
+        mined += 1
+    return mined
+
+
+__all__ = [
+    "exhaustive_mine",
+    "clear_g_cache",
+    "encode_mined_chain",
+    "mine_blocks",
+    "mine_event",
+    "ExhaustiveMiner",
+]
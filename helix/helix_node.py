@@ -296,6 +296,7 @@ class HelixNode(GossipNode):
         if not verify_statement_id(event):
             raise ValueError("invalid statement_id")
         evt_id = event["header"]["statement_id"]
+        event_manager.recount_mined(event)
         self.events[evt_id] = event
         self.save_state()
 
@@ -459,6 +460,8 @@ class HelixNode(GossipNode):
             event = message.get("event")
             if event and verify_statement_id(event):
                 evt_id = event["header"]["statement_id"]
+                # A peer's mined_count is not trusted; closing keys off it.
+                event_manager.recount_mined(event)
                 self.events[evt_id] = event
                 self.save_state()
                 self.forward_message(message)
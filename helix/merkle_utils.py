@@ -1,5 +1,5 @@
 import hashlib
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 
 def _hash(data: bytes) -> bytes:
@@ -7,38 +7,168 @@ def _hash(data: bytes) -> bytes:
     return hashlib.sha256(data).digest()
 
 
+def _next_level(level: bytes) -> bytes:
+    """Return the parent level of packed digests ``level``."""
+    sha256 = hashlib.sha256
+    if len(level) % 64:
+        level += level[-32:]
+    # Hash 64-byte pair windows in place instead of concatenating a
+    # fresh ``left + right`` for every node.
+    view = memoryview(level)
+    return b"".join(sha256(view[i : i + 64]).digest() for i in range(0, len(level), 64))
+
+
+def _merkle_levels(microblocks: List[bytes]) -> List[bytes]:
+    """Return every tree level packed into one buffer of 32-byte digests."""
+    sha256 = hashlib.sha256
+    level = b"".join(sha256(b).digest() for b in microblocks)
+    levels = [level]
+    while len(level) > 32:
+        level = _next_level(level)
+        levels.append(level)
+    return levels
+
+
 def build_merkle_tree(microblocks: List[bytes]) -> Tuple[bytes, List[List[bytes]]]:
     """Return the root and full tree from binary-digest Merkle structure."""
     if not microblocks:
         return b"", []
 
-    level: List[bytes] = [_hash(b) for b in microblocks]
-    tree: List[List[bytes]] = [level]
+    levels = _merkle_levels(microblocks)
+    tree = [[lv[i : i + 32] for i in range(0, len(lv), 32)] for lv in levels]
+    return levels[-1], tree
+
+
+def _parent_of_leaves(microblocks: List[bytes]) -> bytes:
+    """Return tree level 1 without materializing the whole leaf level.
+
+    Leaves are hashed ``_LEAF_CHUNK`` blocks at a time; the chunk size is
+    even, so only the final chunk can need its last leaf duplicated.
+    """
+    sha256 = hashlib.sha256
+    return b"".join(
+        _next_level(b"".join(sha256(b).digest() for b in microblocks[i : i + _LEAF_CHUNK]))
+        for i in range(0, len(microblocks), _LEAF_CHUNK)
+    )
+
+
+_LEAF_CHUNK = 4096
+
+
+def build_flat_merkle_tree(
+    microblocks: List[bytes], *, leaves: bool = True
+) -> Tuple[bytes, List[int], bytes]:
+    """Return ``(root, level_offsets, nodes)`` without per-node lists.
+
+    Same layout as :func:`flatten_merkle_tree` applied to
+    :func:`build_merkle_tree`, but each level is produced as one buffer.
+    With ``leaves=False`` the leaf level is left empty (it is never held in
+    memory whole) unless the tree is a single leaf.
+    """
+    if not microblocks:
+        return b"", [0], b""
+
+    if leaves or len(microblocks) == 1:
+        levels = _merkle_levels(microblocks)
+    else:
+        level = _parent_of_leaves(microblocks)
+        levels = [b"", level]
+        while len(level) > 32:
+            level = _next_level(level)
+            levels.append(level)
+    offsets = [0]
+    for lv in levels:
+        offsets.append(offsets[-1] + len(lv))
+    return levels[-1], offsets, b"".join(levels)
+
+
+def flatten_merkle_tree(tree: List[List[bytes]]) -> Tuple[List[int], bytes]:
+    """Return ``(level_offsets, nodes)`` packing ``tree`` into one buffer.
 
-    while len(level) > 1:
-        next_level: List[bytes] = []
-        for i in range(0, len(level), 2):
-            left = level[i]
-            right = level[i + 1] if i + 1 < len(level) else left
-            next_level.append(_hash(left + right))
-        tree.append(next_level)
-        level = next_level
+    ``nodes`` holds every 32-byte digest level by level and level ``i``
+    occupies ``nodes[level_offsets[i]:level_offsets[i + 1]]``.
+    """
+    offsets = [0]
+    for level in tree:
+        offsets.append(offsets[-1] + 32 * len(level))
+    return offsets, b"".join(h for level in tree for h in level)
 
-    root = level[0]
-    return root, tree
+
+def select_merkle_levels(
+    level_offsets: List[int], nodes: bytes, levels: List[int]
+) -> Tuple[List[int], bytes]:
+    """Return a flattened tree holding only ``levels`` of ``nodes``."""
+    kept = [nodes[level_offsets[i] : level_offsets[i + 1]] for i in levels]
+    offsets = [0]
+    for lv in kept:
+        offsets.append(offsets[-1] + len(lv))
+    return offsets, b"".join(kept)
+
+
+def merkle_subtree(leaf_hashes: bytes, depth: int) -> Tuple[List[int], bytes]:
+    """Return flattened levels ``0..depth`` built up from packed leaf digests.
+
+    ``leaf_hashes`` must be an aligned slice of a tree's leaf level, so the
+    result matches the same nodes of the full tree.
+    """
+    levels = [leaf_hashes]
+    for _ in range(depth):
+        levels.append(_next_level(levels[-1]))
+    offsets = [0]
+    for lv in levels:
+        offsets.append(offsets[-1] + len(lv))
+    return offsets, b"".join(levels)
+
+
+def merkle_level(nodes: bytes, level_offsets: List[int], level: int) -> memoryview:
+    """Return a zero-copy view of ``level`` inside a flattened tree."""
+    return memoryview(nodes)[level_offsets[level]:level_offsets[level + 1]]
+
+
+def merkle_cache_depth(height: int) -> int:
+    """Return the level cached alongside leaves and root for a tree of ``height``.
+
+    Caching the middle level lets a proof stop after ``depth`` hashes and
+    compare against ``layer[index >> depth]`` instead of climbing to the root.
+    """
+    return min(max(1, height // 2), max(0, height - 1))
 
 
 def generate_merkle_proof(index: int, tree: List[List[bytes]]) -> List[bytes]:
-    """Return the Merkle proof for the leaf at ``index`` using ``tree``."""
+    """Return the Merkle proof for the leaf at ``index`` using ``tree``.
+
+    A lone last node is hashed with a copy of itself when the tree is built,
+    so it is its own sibling in the proof.
+    """
     proof: List[bytes] = []
     for level in tree[:-1]:
         sibling_idx = index ^ 1
-        if sibling_idx < len(level):
-            proof.append(level[sibling_idx])
+        proof.append(level[sibling_idx] if sibling_idx < len(level) else level[index])
         index //= 2
     return proof
 
 
+def flat_merkle_proof(
+    index: int, level_offsets: List[int], nodes: bytes, depth: Optional[int] = None
+) -> List[bytes]:
+    """Return the proof for leaf ``index`` read straight from a flattened tree.
+
+    Uses levels ``0..depth-1`` (all but the root by default) and matches
+    :func:`generate_merkle_proof` on the nested form of the same levels.
+    """
+    if depth is None:
+        depth = len(level_offsets) - 2
+    proof: List[bytes] = []
+    for level in range(depth):
+        pos = level_offsets[level] + 32 * (index ^ 1)
+        if pos >= level_offsets[level + 1]:
+            # Lone last node: paired with itself, as in ``_next_level``.
+            pos = level_offsets[level] + 32 * index
+        proof.append(nodes[pos : pos + 32])
+        index >>= 1
+    return proof
+
+
 def verify_merkle_proof(leaf: bytes, proof: List[bytes], root: bytes, index: int) -> bool:
     """Return ``True`` if ``proof`` authenticates ``leaf`` against ``root``."""
     computed = _hash(leaf)
@@ -53,6 +183,13 @@ def verify_merkle_proof(leaf: bytes, proof: List[bytes], root: bytes, index: int
 
 __all__ = [
     "build_merkle_tree",
+    "build_flat_merkle_tree",
+    "flatten_merkle_tree",
+    "merkle_level",
+    "select_merkle_levels",
+    "merkle_cache_depth",
+    "merkle_subtree",
     "generate_merkle_proof",
+    "flat_merkle_proof",
     "verify_merkle_proof",
 ]
@@ -141,22 +141,18 @@ def verify_nested_seed(
         if depth == 0 or depth > max_depth or depth - 1 > max_steps:
             return False
 
-        offset = 2
-        seed = seed_chain[offset: offset + seed_len]
+        seed = seed_chain[2: 2 + seed_len]
         if not _seed_is_valid(seed, N):
             return False
-        offset += seed_len
+        # The length check above guarantees every intermediate block is
+        # exactly ``N`` bytes, so compare in place instead of slicing.
+        g = G
         current = seed
-        for step_num in range(1, depth):
-            if step_num > max_steps:
+        for offset in range(2 + seed_len, expected_len, N):
+            current = g(current, N)
+            if not seed_chain.startswith(current, offset):
                 return False
-            current = G(current, N)
-            next_block = seed_chain[offset: offset + N]
-            if len(next_block) != N or current != next_block:
-                return False
-            offset += N
-        current = G(current, N)
-        return current == target_block
+        return g(current, N) == target_block
 
     if not seed_chain:
         return False
@@ -180,6 +176,22 @@ def verify_nested_seed(
     return current == target_block
 
 
+def verify_nested_seeds_batch(
+    seed_chains: list[bytes | None], target_blocks: list[bytes]
+) -> int:
+    """Return the index of the first seed that fails to verify, or ``-1``.
+
+    Missing seeds (``None``) count as failures.  Each entry is checked with
+    :func:`verify_nested_seed`.
+    """
+
+    verify = verify_nested_seed
+    for idx, (chain, block) in enumerate(zip(seed_chains, target_blocks)):
+        if chain is None or not verify(chain, block):
+            return idx
+    return -1
+
+
 def hybrid_mine(
     target_block: bytes,
     *,
@@ -266,7 +278,12 @@ def parallel_mine_event(
 ) -> int:
     evt, path = _load_event(event, events_dir)
 
-    blocks = [b if isinstance(b, (bytes, bytearray)) else bytes.fromhex(b) for b in evt.get("microblocks", [])]
+    blocks = evt.get("microblocks", [])
+    if isinstance(blocks, str) or (blocks and isinstance(blocks[0], str)):
+        from .event_manager import decode_microblocks
+
+        size = evt.get("header", {}).get("microblock_size", minihelix.DEFAULT_MICROBLOCK_SIZE)
+        blocks = decode_microblocks(blocks, size, evt.get("encoding", "hex"))
     seeds = evt.setdefault("seeds", [None] * len(blocks))
     depths = evt.setdefault("seed_depths", [0] * len(blocks))
     status = evt.setdefault("mined_status", [False] * len(blocks))
@@ -317,5 +334,7 @@ def parallel_mine_event(
         for fut in futures:
             fut.result()
 
+    if "mined_count" in evt:
+        evt["mined_count"] = sum(1 for m in status if m)
     _save_event(evt, path)
     return mined
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import base64
-from typing import Tuple
+from functools import lru_cache
+from typing import Dict, Iterable, List, Tuple
 from pathlib import Path
 
 from nacl import signing
@@ -24,9 +25,7 @@ def generate_keypair() -> Tuple[str, str]:
 
 def sign_data(data: bytes, private_key: str) -> str:
     """Return a base64 signature for ``data`` using ``private_key``."""
-    key_bytes = base64.b64decode(private_key)
-    signing_key = signing.SigningKey(key_bytes)
-    signed = signing_key.sign(data)
+    signed = load_private_key(private_key).sign(data)
     return base64.b64encode(signed.signature).decode("ascii")
 
 
@@ -47,6 +46,33 @@ def verify_signature(data: bytes, signature: str, public_key: str) -> bool:
         return False
 
 
+def verify_signatures(items: Iterable[Tuple[bytes, str, str]]) -> List[bool]:
+    """Verify ``(data, signature, public_key)`` triples in one pass.
+
+    PyNaCl has no batch verification API, so the saving comes from decoding
+    each distinct ``public_key`` into a :class:`~nacl.signing.VerifyKey` only
+    once.  Malformed keys or signatures are reported as ``False``.
+    """
+    keys: Dict[str, signing.VerifyKey | None] = {}
+    results: List[bool] = []
+    for data, signature, public_key in items:
+        if public_key not in keys:
+            try:
+                keys[public_key] = signing.VerifyKey(base64.b64decode(public_key))
+            except Exception:
+                keys[public_key] = None
+        verify_key = keys[public_key]
+        if verify_key is None:
+            results.append(False)
+            continue
+        try:
+            verify_key.verify(data, base64.b64decode(signature))
+            results.append(True)
+        except Exception:
+            results.append(False)
+    return results
+
+
 def save_keys(filename: str, pub: str, priv: str) -> None:
     """Save base64-encoded ``pub`` and ``priv`` keys to ``filename``."""
     with open(filename, "w", encoding="utf-8") as f:
@@ -77,8 +103,13 @@ def load_or_create_keys(filename: str) -> Tuple[str, str]:
     return pub, priv
 
 
+@lru_cache(maxsize=128)
 def load_private_key(private_key: str) -> signing.SigningKey:
-    """Return a :class:`~nacl.signing.SigningKey` for ``private_key``."""
+    """Return a :class:`~nacl.signing.SigningKey` for ``private_key``.
+
+    Key expansion is the expensive part of signing, so keys are cached per
+    base64 string for nodes that sign many statements with one wallet.
+    """
     key_bytes = base64.b64decode(private_key)
     return signing.SigningKey(key_bytes)
 
@@ -88,6 +119,7 @@ __all__ = [
     "sign_statement",
     "sign_data",
     "verify_signature",
+    "verify_signatures",
     "save_keys",
     "load_keys",
     "load_or_create_keys",
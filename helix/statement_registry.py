@@ -56,7 +56,7 @@ class StatementRegistry:
             if not fname.endswith(".json"):
                 continue
             try:
-                event = event_manager.load_event(os.path.join(events_dir, fname))
+                event = event_manager.load_event_header(os.path.join(events_dir, fname))
             except Exception:
                 continue
             if event.get("is_closed"):
@@ -47,7 +47,7 @@ def _show_microblocks() -> None:
             print(f"Error reading {path.name}: {exc}")
             continue
         mined = sum(1 for m in event.get("mined_status", []) if m)
-        total = len(event.get("microblocks", []))
+        total = event.get("header", {}).get("block_count", len(event.get("mined_status", [])))
         print(f"{path.name}: {mined}/{total} microblocks mined")
 
 
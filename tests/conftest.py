@@ -4,6 +4,7 @@ import random
 import time
 import pytest
 
+import blockchain
 from helix import event_manager, minihelix, signature_utils
 
 if importlib.util.find_spec("nacl") is None:
@@ -31,6 +32,13 @@ def _deterministic(monkeypatch):
     monkeypatch.setattr(time, "time", lambda: 1_700_000_000.0)
 
 
+@pytest.fixture(autouse=True)
+def _close_chain_files():
+    """Release append descriptors for chain files under ``tmp_path``."""
+    yield
+    blockchain.close_append_fds()
+
+
 @pytest.fixture
 def dummy_wallet() -> dict:
     """Return a dictionary with a generated Ed25519 keypair."""
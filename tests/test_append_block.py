@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+import blockchain as bc
+
+
+def test_append_block_reuses_descriptor(tmp_path):
+    chain_file = tmp_path / "chain.jsonl"
+    bc.append_block({"block_id": "a"}, path=str(chain_file))
+    bc.append_block({"block_id": "b"}, path=str(chain_file))
+    assert [b["block_id"] for b in bc.load_chain(str(chain_file))] == ["a", "b"]
+
+
+def test_append_block_follows_replaced_file(tmp_path):
+    chain_file = tmp_path / "chain.jsonl"
+    bc.append_block({"block_id": "a"}, path=str(chain_file))
+    chain_file.unlink()
+    bc.append_block({"block_id": "b"}, path=str(chain_file))
+    assert [b["block_id"] for b in bc.load_chain(str(chain_file))] == ["b"]
+
+    replacement = tmp_path / "new.jsonl"
+    replacement.write_text('{"block_id":"c"}\n')
+    replacement.replace(chain_file)
+    bc.append_block({"block_id": "d"}, path=str(chain_file))
+    assert bc.get_chain_tip(str(chain_file)) == "d"
+    assert len(bc.load_chain(str(chain_file))) == 2
+
+
+def test_load_last_block_reads_tail(tmp_path, monkeypatch):
+    monkeypatch.setattr(bc, "_TAIL_CHUNK", 8)
+    chain_file = tmp_path / "chain.jsonl"
+    assert bc.load_last_block(str(chain_file)) is None
+
+    chain_file.write_text(
+        '{"block_id":"a","pad":"xxxxxxxxxxxxxxxx"}\n\n{"block_id":"b"}\nnot json\n\n'
+    )
+    assert bc.load_last_block(str(chain_file)) == bc.load_chain(str(chain_file))[-1]
+    assert bc.load_last_block(str(chain_file))["block_id"] == "b"
+
+    bc.append_block({"block_id": "c"}, path=str(chain_file))
+    assert bc.load_last_block(str(chain_file))["block_id"] == "c"
+
+
+def test_append_block_seeds_last_block_cache(tmp_path, monkeypatch):
+    chain_file = tmp_path / "chain.jsonl"
+    bc.append_block({"block_id": "a"}, path=str(chain_file))
+    bc.append_block({"block_id": "b", "n": (1, 2)}, path=str(chain_file))
+
+    def fail(path):
+        raise AssertionError("tail should not be re-read")
+
+    monkeypatch.setattr(bc, "_read_last_block", fail)
+    assert bc.load_last_block(str(chain_file)) == {"block_id": "b", "n": [1, 2]}
+
+
+def test_close_append_fds(tmp_path):
+    chain_file = tmp_path / "chain.jsonl"
+    bc.append_block({"block_id": "a"}, path=str(chain_file))
+    [(fd, _, _)] = bc._APPEND_FDS.values()
+    bc.close_append_fds()
+    assert bc._APPEND_FDS == {}
+    with pytest.raises(OSError):
+        os.fstat(fd)
+    bc.append_block({"block_id": "b"}, path=str(chain_file))
+    assert bc.get_chain_tip(str(chain_file)) == "b"
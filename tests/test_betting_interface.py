@@ -29,3 +29,28 @@ def test_invalid_bet_choice(tmp_path):
     with pytest.raises(ValueError):
         bi.submit_bet("id", "MAYBE", 5, str(keyfile))
 
+
+
+def test_verify_bets_batch(tmp_path):
+    pub, priv = su.generate_keypair()
+    keyfile = tmp_path / "keys.txt"
+    su.save_keys(str(keyfile), pub, priv)
+
+    good = bi.submit_bet("id", "YES", 10, str(keyfile))
+    forged = dict(bi.submit_bet("id", "NO", 5, str(keyfile)), amount=500)
+    malformed = {"event_id": "id", "choice": "YES"}
+
+    bets = [good, forged, malformed]
+    assert bi.verify_bets(bets) == [bi.verify_bet(b) for b in bets]
+    assert bi.verify_bets(bets) == [True, False, False]
+
+    event = {"bets": {"YES": [good, malformed], "NO": [forged]}}
+    assert bi.get_bets_for_event(event) == ([good], [])
+
+
+def test_verify_legacy_repr_bet():
+    pub, priv = su.generate_keypair()
+    payload = {"event_id": "id", "choice": "NO", "amount": 3, "pubkey": pub}
+    bet = dict(payload, signature=su.sign_data(repr(payload).encode("utf-8"), priv))
+    assert bi.verify_bet(bet)
+    assert not bi.verify_bet(dict(bet, amount=4))
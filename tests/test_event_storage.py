@@ -0,0 +1,200 @@
+import base64
+import gc
+import json
+import os
+import pytest
+
+pytest.importorskip("nacl")
+
+from helix import event_manager as em
+from helix.merkle_utils import build_merkle_tree, generate_merkle_proof, verify_merkle_proof
+
+
+def test_microblocks_saved_as_single_base64_string(tmp_path):
+    event = em.create_event("round trip storage", microblock_size=4)
+    event["seeds"][0] = b"\x01\x01a"
+    path = em.save_event(event, str(tmp_path))
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = json.load(fh)
+    assert raw["encoding"] == "base64"
+    nodes = event["merkle_tree"]["nodes"]
+    assert type(nodes) is bytes
+    assert raw["merkle_tree"]["nodes"] == base64.b64encode(nodes).decode()
+    assert raw["microblocks"] == base64.b64encode(b"".join(event["microblocks"])).decode()
+    loaded = em.load_event(path)
+    assert "encoding" not in loaded
+    assert loaded["microblocks"] == event["microblocks"]
+    assert loaded["merkle_tree"] == event["merkle_tree"]
+    assert loaded["seeds"] == event["seeds"]
+
+
+def test_load_event_accepts_legacy_microblock_list(tmp_path):
+    event = em.create_event("legacy storage", microblock_size=4)
+    path = em.save_event(event, str(tmp_path))
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = json.load(fh)
+    # Files written before the encoding field carried hex everywhere.
+    del raw["encoding"]
+    raw["microblocks"] = [b.hex() for b in event["microblocks"]]
+    raw["merkle_tree"] = dict(event["merkle_tree"], nodes=event["merkle_tree"]["nodes"].hex())
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(raw, fh)
+    loaded = em.load_event(path)
+    assert loaded["microblocks"] == event["microblocks"]
+    assert loaded["merkle_tree"] == event["merkle_tree"]
+
+
+def test_large_event_spills_to_packed_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(em, "MAX_RAM_MICROBLOCK_BYTES", 16)
+    statement = "a statement long enough to spill"
+    event = em.create_event(statement, microblock_size=4)
+    evt_id = event["header"]["statement_id"]
+    blocks = event["microblocks"]
+    assert isinstance(blocks, em.PackedMicroblocks)
+    assert len(blocks) == event["header"]["block_count"]
+    assert em.load_microblock(event, -1) == blocks[len(blocks) - 1]
+    assert em.reassemble_microblocks(blocks) == statement
+
+    # The spill file is private and the leaf level is not kept in memory.
+    assert os.path.basename(blocks.path) != f"helix_{evt_id}.pack"
+    assert oct(os.stat(blocks.path).st_mode & 0o777) == "0o600"
+    depth = event["merkle_tree"]["levels"][0]
+    assert depth != 0
+    _, tree = build_merkle_tree(list(blocks))
+    for idx in range(len(blocks)):
+        proof, anchor = em.merkle_proof(event, idx)
+        assert proof == generate_merkle_proof(idx, tree[: depth + 1])
+        assert anchor == tree[depth][idx >> depth]
+        assert verify_merkle_proof(blocks[idx], proof, anchor, idx)
+
+    path = em.save_event(event, str(tmp_path))
+    assert em.load_event(path)["microblocks"] == list(blocks)
+
+    spill = blocks.path
+    em.cleanup_microblocks(event)
+    assert evt_id not in em._MICROBLOCK_STORES
+    assert not os.path.exists(spill)
+    assert em.reassemble_microblocks(blocks) == statement
+    blocks.close()
+
+
+def test_discarded_spill_file_is_removed(monkeypatch):
+    monkeypatch.setattr(em, "MAX_RAM_MICROBLOCK_BYTES", 16)
+    event = em.create_event("a statement long enough to spill", microblock_size=4)
+    spill = event["microblocks"].path
+    assert os.path.exists(spill)
+    del event
+    gc.collect()
+    assert not os.path.exists(spill)
+
+
+def test_save_event_replaces_file_atomically(tmp_path):
+    event = em.create_event("atomic save", microblock_size=4)
+    path = em.save_event(event, str(tmp_path))
+    event["seeds"][0] = b"\x01\x01a"
+    assert em.save_event(event, str(tmp_path)) == path
+    assert [p.name for p in tmp_path.iterdir()] == [f"{event['header']['statement_id']}.json"]
+    assert em.load_event(path)["seeds"][0] == b"\x01\x01a"
+
+
+def test_save_event_removes_temp_file_on_failure(tmp_path, monkeypatch):
+    event = em.create_event("atomic save", microblock_size=4)
+    path = em.save_event(event, str(tmp_path))
+
+    def fail(data):
+        raise RuntimeError("encode failed")
+
+    monkeypatch.setattr(em, "_dump_json", fail)
+    with pytest.raises(RuntimeError):
+        em.save_event(event, str(tmp_path))
+    assert [p.name for p in tmp_path.iterdir()] == [os.path.basename(path)]
+
+
+def test_mined_count_tracks_mark_mined(tmp_path):
+    event = em.create_event("count me", microblock_size=8)
+    count = event["header"]["block_count"]
+    em.mark_mined(event, 0)
+    em.mark_mined(event, 0)
+    assert event["mined_count"] == 1
+    assert not event["is_closed"]
+
+    path = em.save_event(event, str(tmp_path))
+    with open(path, "r", encoding="utf-8") as fh:
+        raw = json.load(fh)
+    raw["mined_status"][1] = True
+    raw["mined_count"] = 0
+    with open(path, "w", encoding="utf-8") as fh:
+        json.dump(raw, fh)
+    loaded = em.load_event(path)
+    assert loaded["mined_count"] == 2
+
+    for i in range(count):
+        em.mark_mined(loaded, i)
+    assert loaded["mined_count"] == count
+    assert loaded["is_closed"]
+
+
+def test_submit_microblock_fills_slots(monkeypatch):
+    finalized = []
+    monkeypatch.setattr(em, "finalize_event", finalized.append)
+    monkeypatch.setitem(em.event_metadata, "evt", {"block_count": 2, "microblock_size": 4, "filled": 0})
+
+    em.submit_microblock("evt", 1, b"a", "m1")
+    em.submit_microblock("evt", 1, b"b", "m2")
+    assert em.event_metadata["evt"]["filled"] == 1
+    assert em.pending_seeds["evt"] == [None, b"b"]
+    assert finalized == []
+
+    em.submit_microblock("evt", 0, b"c", "m3")
+    assert finalized == ["evt"]
+    assert em.pending_miners["evt"] == ["m3", "m2"]
+    with pytest.raises(IndexError):
+        em.submit_microblock("evt", 2, b"d", "m4")
+
+    for store in (em.pending_microblocks, em.pending_seeds, em.pending_miners):
+        store.pop("evt", None)
+
+
+@pytest.mark.parametrize("payload", [0, 202, 482, 620])
+def test_merkle_proof_verifies_partial_subtree(payload):
+    # 86 header bytes plus ``payload`` give 11, 36, 71 and 89 blocks of 8.
+    event = em.create_event("x" * payload, microblock_size=8)
+    for idx, block in enumerate(event["microblocks"]):
+        proof, anchor = em.merkle_proof(event, idx)
+        assert verify_merkle_proof(block, proof, anchor, idx)
+
+
+def test_merkle_proof_from_cached_layer():
+    event = em.create_event("proof " * 20, microblock_size=4)
+    _, tree = build_merkle_tree(event["microblocks"])
+    depth = event["merkle_tree"]["levels"][1]
+    assert 0 < depth < len(tree) - 1
+
+    read = []
+
+    class _Nodes(bytes):
+        def __getitem__(self, key):
+            part = bytes.__getitem__(self, key)
+            read.append(len(part))
+            return part
+
+    event["merkle_tree"]["nodes"] = _Nodes(event["merkle_tree"]["nodes"])
+    for idx in range(event["header"]["block_count"]):
+        proof, anchor = em.merkle_proof(event, idx)
+        assert proof == generate_merkle_proof(idx, tree[: depth + 1])
+        assert anchor == tree[depth][idx >> depth]
+    # Only the anchor's leaf subtree is read, never the whole tree.
+    assert max(read) <= 32 * (1 << depth)
+
+
+def test_load_event_header_skips_payload(tmp_path, monkeypatch):
+    event = em.create_event("listing", microblock_size=4)
+    em.mark_mined(event, 0)
+    path = em.save_event(event, str(tmp_path))
+
+    monkeypatch.setattr(em, "decode_microblocks", None)
+    summary = em.load_event_header(path)
+    assert summary["header"] == event["header"]
+    assert summary["statement"] == "listing"
+    assert summary["mined_count"] == 1
+    assert summary["is_closed"] is event["is_closed"]
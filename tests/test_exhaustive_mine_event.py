@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("nacl")
+
+from helix import event_manager as em
+from helix import exhaustive_miner, minihelix, nested_miner
+
+
+def _event(seeds, size=2):
+    blocks = [minihelix.G(s, size) for s in seeds]
+    count = len(blocks)
+    return {
+        "header": {"block_count": count, "microblock_size": size},
+        "microblocks": blocks,
+        "seeds": [None] * count,
+        "mined_status": [False] * count,
+        "mined_count": 0,
+        "is_closed": False,
+    }
+
+
+def test_mine_event_seeds_verify(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    event = _event([b"\x01", b"\x00\x33", b"\x01", b"\xab\xcd"])
+    chain_file = tmp_path / "chain.jsonl"
+    events_dir = tmp_path / "events"
+    events_dir.mkdir()
+
+    mined = exhaustive_miner.mine_event(
+        event, max_depth=3, workers=1, chain_file=str(chain_file), events_dir=str(events_dir)
+    )
+
+    assert mined == 4
+    for seed, block in zip(event["seeds"], event["microblocks"]):
+        assert nested_miner.verify_nested_seed(seed, block)
+    assert em.verify_statement(event)
+    assert event["finalized"]
+    assert chain_file.exists()
+    assert list(events_dir.glob("*.json"))
+
+
+def test_encode_mined_chain_rejects_oversized_seed():
+    block = minihelix.G(b"\x12\x34", 1)
+    assert exhaustive_miner.encode_mined_chain([b"\x12\x34"], block) is None
+    assert exhaustive_miner.encode_mined_chain([b"\x07", b"\x12"], minihelix.G(b"\x12", 1)) == (
+        b"\x01\x01\x12"
+    )
+
+
+def _one_byte_mine(block, *, max_depth=5):
+    # Stand-in for the full search: only tries 1-byte tail seeds, but
+    # returns a multi-seed chain like the DFS does.
+    for seed in exhaustive_miner._SEEDS_BY_LEN[1]:
+        if minihelix.G(seed, len(block)) == block:
+            return [b"\x07", seed]
+    return None
+
+
+def test_replay_and_remine_pool(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(exhaustive_miner.os, "cpu_count", lambda: 2)
+    monkeypatch.setattr(exhaustive_miner, "exhaustive_mine", _one_byte_mine)
+    pools = []
+    real_pool = exhaustive_miner.ProcessPoolExecutor
+    monkeypatch.setattr(
+        exhaustive_miner,
+        "ProcessPoolExecutor",
+        lambda **kw: pools.append(kw) or real_pool(**kw),
+    )
+    event = em.create_event("remine", microblock_size=1)
+    em.save_event(event, str(tmp_path / "data" / "events"))
+
+    remined = em.replay_and_remine(event["header"]["statement_id"])
+
+    assert pools == [{"max_workers": 2}]
+    assert remined
+    for idx, seed in remined.items():
+        assert nested_miner.verify_nested_seed(seed, event["microblocks"][idx])
@@ -1,8 +1,6 @@
 import pytest
 from helix import exhaustive_miner, minihelix
 
-pytest.skip("Exhaustive miner incompatible with streamed hash", allow_module_level=True)
-
 
 def test_exhaustive_mine_single_seed(capsys):
     N = 4
@@ -15,6 +13,7 @@ def test_exhaustive_mine_single_seed(capsys):
     assert miner.attempts > 0
 
 
+@pytest.mark.skip(reason="expected chain depends on the pre-streaming G")
 def test_exhaustive_mine_nested_seed(capsys):
     N = 4
     base_seed = bytes.fromhex("cf")
@@ -28,6 +27,7 @@ def test_exhaustive_mine_nested_seed(capsys):
     assert miner.attempts > 0
 
 
+@pytest.mark.skip(reason="expected chain depends on the pre-streaming G")
 def test_exhaustive_mine_failure(capsys):
     N = 2
     seed = b"xyz"
@@ -78,3 +78,69 @@ def test_exhaustive_mine_start_index_out_of_range():
     start = len(list(exhaustive_miner._generate_initial_seeds()))
     result = exhaustive_miner.exhaustive_mine(target, max_depth=1, start_index=start)
     assert result is None
+
+
+def _reference_mine(target, max_depth, start_index=0):
+    """Recursive form of the search, with the same subtree pruning."""
+    size = len(target)
+    attempts = 0
+    exhausted = set()
+
+    def dfs(seed, chain):
+        nonlocal attempts
+        if len(chain) >= max_depth:
+            return None
+        attempts += 1
+        output = minihelix.G(seed, size)
+        chain.append(seed)
+        if output == target:
+            return list(chain)
+        next_len = output[0]
+        key = (len(chain), next_len)
+        if (
+            next_len == 0
+            or next_len > size
+            or next_len > 2
+            or len(chain) >= max_depth - 1
+            or key in exhausted
+        ):
+            chain.pop()
+            return None
+        for i in range(256 ** next_len):
+            result = dfs(i.to_bytes(next_len, "big"), chain)
+            if result is not None:
+                return result
+        exhausted.add(key)
+        chain.pop()
+        return None
+
+    for seed in list(exhaustive_miner._generate_initial_seeds())[start_index:]:
+        result = dfs(seed, [])
+        if result is not None:
+            return result, attempts
+    return None, attempts
+
+
+@pytest.mark.parametrize("max_depth", [1, 2, 3, 4])
+@pytest.mark.parametrize("seed, size", [(b"\x9c", 4), (b"\x00\x33", 4), (b"\x05", 2)])
+def test_exhaustive_mine_matches_recursive_search(seed, size, max_depth, capsys):
+    target = minihelix.G(seed, size)
+    miner = exhaustive_miner.ExhaustiveMiner(target, max_depth=max_depth)
+    assert (miner.mine(), miner.attempts) == _reference_mine(target, max_depth)
+
+
+@pytest.mark.parametrize("max_depth", [2, 3])
+def test_exhaustive_mine_miss_matches_recursive_search(max_depth):
+    target = b"\xff\xfe\xfd\xfc"
+    start = len(list(exhaustive_miner._generate_initial_seeds())) - 300
+    miner = exhaustive_miner.ExhaustiveMiner(target, max_depth=max_depth)
+    result = miner.mine(start_index=start)
+    assert (result, miner.attempts) == _reference_mine(target, max_depth, start)
+    assert result is None
+
+
+def test_clear_g_cache():
+    exhaustive_miner._cached_G(b"\x01", 4)
+    assert exhaustive_miner._cached_G.cache_info().currsize > 0
+    exhaustive_miner.clear_g_cache()
+    assert exhaustive_miner._cached_G.cache_info().currsize == 0
@@ -28,3 +28,48 @@ def test_finalized_log_written(tmp_path, monkeypatch):
     assert entry["miner_id"] == "MINER"
     assert entry["delta_seconds"] == event["block_header"]["delta_seconds"]
     assert entry["compression_reward"] == event["miner_reward"]
+
+
+def test_block_id_matches_sorted_json(tmp_path, monkeypatch):
+    import hashlib
+
+    monkeypatch.chdir(tmp_path)
+    event = em.create_event("canonical é", microblock_size=5)
+    for idx in range(event["header"]["block_count"]):
+        em.accept_mined_seed(event, idx, bytes([1, 1]) + b"a", miner="Mü")
+
+    header = dict(event["block_header"])
+    block_id = header.pop("block_id")
+    expected = hashlib.sha256(json.dumps(header, sort_keys=True).encode("utf-8")).hexdigest()
+    assert block_id == expected
+    assert em._canonical_block_bytes(header) == json.dumps(header, sort_keys=True).encode("utf-8")
+    header["extra"] = [1, 2]
+    assert em._canonical_block_bytes(header) == json.dumps(header, sort_keys=True).encode("utf-8")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "ascii",
+        "non-ascii é ☃ \U0001f600",
+        "quote \" backslash \\ control \n\t\x01",
+        0.1,
+        1e-7,
+        1e16,
+        -0.0,
+        float("inf"),
+        float("nan"),
+        10**30,
+        -5,
+        None,
+        True,
+        False,
+        {"z": 1, "a": {"é": [1.5, None]}},
+        [3, "b", {"y": 2, "x": 1}],
+    ],
+)
+def test_canonical_block_bytes_byte_identical(value):
+    for key in em._BLOCK_HEADER_KEYS:
+        header = {k: f"v-{k}" for k in em._BLOCK_HEADER_KEYS}
+        header[key] = value
+        assert em._canonical_block_bytes(header) == json.dumps(header, sort_keys=True).encode("utf-8")
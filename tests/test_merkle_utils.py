@@ -0,0 +1,84 @@
+import pytest
+
+from helix import merkle_utils
+
+
+def test_flattened_tree_levels_match():
+    blocks = [bytes([i]) * 4 for i in range(5)]
+    root, tree = merkle_utils.build_merkle_tree(blocks)
+    offsets, nodes = merkle_utils.flatten_merkle_tree(tree)
+
+    assert len(offsets) == len(tree) + 1
+    assert len(nodes) == offsets[-1]
+    for i, level in enumerate(tree):
+        assert merkle_utils.merkle_level(nodes, offsets, i).tobytes() == b"".join(level)
+    assert merkle_utils.merkle_level(nodes, offsets, len(tree) - 1).tobytes() == root
+
+
+@pytest.mark.parametrize("count", [1, 2, 3, 4, 5, 7, 11, 36, 71])
+def test_merkle_proof_round_trip(count):
+    blocks = [bytes([i]) * 4 for i in range(count)]
+    root, tree = merkle_utils.build_merkle_tree(blocks)
+    offsets, nodes = merkle_utils.flatten_merkle_tree(tree)
+    for idx, block in enumerate(blocks):
+        proof = merkle_utils.generate_merkle_proof(idx, tree)
+        assert merkle_utils.verify_merkle_proof(block, proof, root, idx)
+        flat = merkle_utils.flat_merkle_proof(idx, offsets, nodes)
+        assert merkle_utils.verify_merkle_proof(block, flat, root, idx)
+
+
+@pytest.mark.parametrize("count", [16, 11, 36, 71])
+def test_proof_against_cached_layer(count):
+    blocks = [bytes([i]) * 4 for i in range(count)]
+    _, tree = merkle_utils.build_merkle_tree(blocks)
+    depth = merkle_utils.merkle_cache_depth(len(tree))
+    assert 0 < depth < len(tree) - 1
+    layer = tree[depth]
+    for idx, block in enumerate(blocks):
+        proof = merkle_utils.generate_merkle_proof(idx, tree[: depth + 1])
+        assert len(proof) == depth
+        assert merkle_utils.verify_merkle_proof(block, proof, layer[idx >> depth], idx)
+
+
+def test_cache_depth_small_trees():
+    assert merkle_utils.merkle_cache_depth(0) == 0
+    assert merkle_utils.merkle_cache_depth(1) == 0
+    assert merkle_utils.merkle_cache_depth(2) == 1
+
+
+def test_flat_builder_matches_nested_tree():
+    for n in range(1, 12):
+        blocks = [bytes([i]) * 3 for i in range(n)]
+        root, tree = merkle_utils.build_merkle_tree(blocks)
+        offsets, nodes = merkle_utils.flatten_merkle_tree(tree)
+        assert merkle_utils.build_flat_merkle_tree(blocks) == (root, offsets, nodes)
+
+    kept_offsets, kept = merkle_utils.select_merkle_levels(offsets, nodes, [0, len(tree) - 1])
+    assert kept == b"".join(tree[0]) + root
+    assert kept_offsets == [0, 32 * len(tree[0]), 32 * len(tree[0]) + 32]
+
+
+def test_flat_proof_matches_nested_proof():
+    for n in range(1, 12):
+        blocks = [bytes([i]) * 3 for i in range(n)]
+        root, offsets, nodes = merkle_utils.build_flat_merkle_tree(blocks)
+        _, tree = merkle_utils.build_merkle_tree(blocks)
+        for idx in range(n):
+            assert merkle_utils.flat_merkle_proof(idx, offsets, nodes) == (
+                merkle_utils.generate_merkle_proof(idx, tree)
+            )
+
+
+def test_flat_builder_without_leaves(monkeypatch):
+    monkeypatch.setattr(merkle_utils, "_LEAF_CHUNK", 4)
+    for n in range(1, 12):
+        blocks = [bytes([i]) * 3 for i in range(n)]
+        root, offsets, nodes = merkle_utils.build_flat_merkle_tree(blocks)
+        lean_root, lean_offsets, lean_nodes = merkle_utils.build_flat_merkle_tree(
+            blocks, leaves=False
+        )
+        assert lean_root == root
+        assert len(lean_offsets) == len(offsets)
+        if n > 1:
+            assert lean_offsets[1] == 0
+            assert lean_nodes == nodes[offsets[1]:]
@@ -83,3 +83,29 @@ def test_unpack_seed_chain_validate_output():
         nested_miner.unpack_seed_chain(forged, block_size=N, validate_output=False)
         == target
     )
+
+
+def test_verify_nested_seed_encoded_bytes():
+    N = 4
+    seed = b"s"
+    intermediate = minihelix.G(seed, N)
+    target = minihelix.G(intermediate, N)
+
+    encoded = bytes([2, len(seed)]) + seed + intermediate
+    assert nested_miner.verify_nested_seed(encoded, target)
+
+    forged = encoded[:-1] + bytes([encoded[-1] ^ 1])
+    assert not nested_miner.verify_nested_seed(forged, target)
+    assert not nested_miner.verify_nested_seed(encoded + b"\x00", target)
+
+
+def test_verify_nested_seeds_batch_first_failure():
+    N = 4
+    seeds = [b"a", b"b", b"c"]
+    blocks = [minihelix.G(s, N) for s in seeds]
+    chains = [bytes([1, 1]) + s for s in seeds]
+    assert nested_miner.verify_nested_seeds_batch(chains, blocks) == -1
+    chains[1] = bytes([1, 1]) + b"z"
+    assert nested_miner.verify_nested_seeds_batch(chains, blocks) == 1
+    chains[0] = None
+    assert nested_miner.verify_nested_seeds_batch(chains, blocks) == 0
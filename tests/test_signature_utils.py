@@ -26,3 +26,9 @@ def test_load_or_create_keys(tmp_path):
     assert keyfile.exists()
     pub2, priv2 = su.load_or_create_keys(str(keyfile))
     assert (pub1, priv1) == (pub2, priv2)
+
+
+def test_load_private_key_is_cached():
+    pub, priv = su.generate_keypair()
+    assert su.load_private_key(priv) is su.load_private_key(priv)
+    assert su.verify_signature(b"data", su.sign_data(b"data", priv), pub)
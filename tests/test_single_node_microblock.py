@@ -1,3 +1,4 @@
+import hashlib
 import threading
 import time
 import pytest
@@ -36,6 +37,8 @@ def test_single_node_microblock(tmp_path, monkeypatch, capsys):
 
     send_event = event.copy()
     send_event["microblocks"] = [b.hex() for b in send_event["microblocks"]]
+    tree = send_event["merkle_tree"]
+    send_event["merkle_tree"] = dict(tree, nodes=tree["nodes"].hex())
     node.send_message({"type": GossipMessageType.NEW_STATEMENT, "event": send_event})
     node.mine_event(event)
     time.sleep(0.1)
@@ -45,3 +48,23 @@ def test_single_node_microblock(tmp_path, monkeypatch, capsys):
     assert reassembled == statement
 
     print("SUCCESS")
+
+
+def test_gossiped_mined_count_is_recounted(tmp_path, monkeypatch):
+    node = HelixNode(
+        events_dir=str(tmp_path / "events"),
+        balances_file=str(tmp_path / "balances.json"),
+        node_id="B",
+        network=LocalGossipNetwork(),
+        microblock_size=3,
+    )
+    monkeypatch.setattr(node, "save_state", lambda: None)
+    monkeypatch.setattr(node, "forward_message", lambda message: None)
+    event = event_manager.create_event("abc", microblock_size=3)
+    event["header"]["statement_id"] = hashlib.sha256(b"abc").hexdigest()
+    event["mined_status"][0] = True
+    event["mined_count"] = event["header"]["block_count"]
+
+    node._handle_message({"type": GossipMessageType.NEW_STATEMENT, "event": event})
+    stored = node.events[event["header"]["statement_id"]]
+    assert stored["mined_count"] == 1
@@ -0,0 +1,73 @@
+import sys
+
+import pytest
+
+pytest.importorskip("nacl")
+
+from helix import event_manager as em
+from helix import minihelix
+
+
+def _mined_event():
+    blocks = [bytes([i]) for i in range(16)]
+    seeds = []
+    for block in blocks:
+        for s in range(256):
+            if minihelix.G(bytes([s]), 1) == block:
+                seeds.append(bytes([1, 1, s]))
+                break
+        else:
+            seeds.append(None)
+    pairs = [(b, s) for b, s in zip(blocks, seeds) if s is not None]
+    return {"microblocks": [b for b, _ in pairs], "seeds": [s for _, s in pairs]}
+
+
+@pytest.mark.parametrize("threshold", [10**9, 2])
+def test_verify_statement_serial_and_parallel(monkeypatch, threshold):
+    monkeypatch.setattr(em, "PARALLEL_VERIFY_MIN_BLOCKS", threshold)
+    # Pretend to have two cores so the parallel case really uses the pool.
+    monkeypatch.setattr(em.os, "cpu_count", lambda: 2)
+    pools = []
+    real_pool = em.ProcessPoolExecutor
+
+    def _pool(**kwargs):
+        pools.append(kwargs)
+        return real_pool(**kwargs)
+
+    monkeypatch.setattr(em, "ProcessPoolExecutor", _pool)
+    # Some tests stub helix.nested_miner in sys.modules; workers unpickle
+    # verify_nested_seed by module name.
+    monkeypatch.setitem(sys.modules, "helix.nested_miner", em.nested_miner)
+    event = _mined_event()
+    assert event["microblocks"]
+    assert em.verify_statement(event)
+    event["microblocks"][0] = bytes([event["microblocks"][0][0] ^ 1])
+    assert not em.verify_statement(event)
+    event["seeds"][0] = None
+    assert not em.verify_statement(event)
+    assert pools == ([{"max_workers": 2}] * 2 if threshold == 2 else [])
+
+
+def test_verify_statement_checks_merkle_root_first(monkeypatch):
+    from helix.merkle_utils import build_merkle_tree
+
+    event = _mined_event()
+    event["header"] = {"merkle_root": build_merkle_tree(event["microblocks"])[0].hex()}
+    assert em.verify_statement(event)
+
+    calls = []
+    monkeypatch.setattr(
+        em.nested_miner, "verify_nested_seed", lambda c, b: calls.append(b) or True
+    )
+    event["header"]["merkle_root"] = "00" * 32
+    assert not em.verify_statement(event)
+    assert calls == []
+
+
+def test_verify_statement_rejects_hex_microblocks():
+    from helix.merkle_utils import build_merkle_tree
+
+    event = _mined_event()
+    event["header"] = {"merkle_root": build_merkle_tree(event["microblocks"])[0].hex()}
+    event["microblocks"] = [b.hex() for b in event["microblocks"]]
+    assert em.verify_statement(event) is False